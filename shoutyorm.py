@@ -13,9 +13,16 @@ in your django project's INSTALLED_APPS, and set
 SHOUTY_LOCAL_FIELDS / SHOUTY_RELATION_FIELDS / SHOUTY_RELATION_REVERSE_FIELDS
 to True/False as desired.
 
+Setting the SHOUTY_DISABLE environment variable to 1 prevents the patches
+being applied at all.
+
 If for whatever reason the patches aren't applied soon enough, you should be
 able to manually call shoutyorm.patch(...) to set them up.
 
+Once applied, the checks can be temporarily switched off for a block of code
+(eg: in a test which deliberately triggers the extra queries) by using
+`with shoutyorm.disabled(): ...`
+
 Patches are expected to work on Django 2.2 (LTS) onwards.
 
 Settings
@@ -51,13 +58,13 @@ from __future__ import absolute_import, unicode_literals
 
 import logging
 import os
+from contextlib import contextmanager
 
 from django import VERSION as DJANGO_VERSION
 from django.db.models.query_utils import DeferredAttribute
-from wrapt import CallableObjectProxy
 
 try:
-    from typing import Text, Any, Optional
+    from typing import Text, Any, Optional, Dict, Tuple, Set, Iterator, Iterable, Type
 except ImportError:  # pragma: no cover
     pass
 
@@ -101,15 +108,16 @@ class MissingReverseRelationField(MissingRelationField):
     pass
 
 
-_TMPL_MISSING_LOCAL = "Access to '{attr}' attribute on {cls} was prevented because it was not selected.\nProbably defer() or only() were used."
-_TMPL_MISSING_ANY_PREFETCH_REVERSE = "Access to reverse manager '{attr}' on {cls} was prevented because it was not selected.\nProbably missing from prefetch_related()"
-_TMPL_MISSING_SPECIFIC_PREFETCH_REVERSE = "Access to reverse manager '{attr}' on {cls} was prevented.\nIt was not part of the prefetch_related() selection used"
-_TMPL_MISSING_M2M_PREFETCH = "Access to '{attr}' ManyToMany manager attribute on {cls} was prevented because it was not selected.\nProbably missing from prefetch_related()"
-_TMPL_MISSING_LOCAL_FK = "Access to '{attr}' attribute on {cls} was prevented because it was not selected.\nProbably missing from prefetch_related() or select_related()"
-_TMPL_MISSING_REVERSE_121 = "Access to '{attr}' relation attribute on {cls} was prevented because it was not selected.\nProbably missing from select_related()"
+_TMPL_MISSING_LOCAL = "Access to '%s' attribute on %s was prevented because it was not selected.\nProbably defer() or only() were used."
+_TMPL_MISSING_ANY_PREFETCH_REVERSE = "Access to reverse manager '%s' on %s was prevented because it was not selected.\nProbably missing from prefetch_related()"
+_TMPL_MISSING_SPECIFIC_PREFETCH_REVERSE = "Access to reverse manager '%s' on %s was prevented.\nIt was not part of the prefetch_related() selection used"
+_TMPL_MISSING_M2M_PREFETCH = "Access to '%s' ManyToMany manager attribute on %s was prevented because it was not selected.\nProbably missing from prefetch_related()"
+_TMPL_MISSING_LOCAL_FK = "Access to '%s' attribute on %s was prevented because it was not selected.\nProbably missing from prefetch_related() or select_related()"
+_TMPL_MISSING_REVERSE_121 = "Access to '%s' relation attribute on %s was prevented because it was not selected.\nProbably missing from select_related()"
 
 __all__ = [
     "patch",
+    "disabled",
     "Shout",
     "default_app_config",
     "get_version",
@@ -119,6 +127,33 @@ __all__ = [
     "MissingReverseRelationField",
 ]
 
+# Formatting the error messages is the same work every time for a given
+# descriptor & model class, so it's done once per pair and remembered here.
+# Descriptors and model classes live for the lifetime of the process, so
+# there's no real need to weakly reference either.
+# Anything which only depends on the descriptor (eg: the related name) is
+# instead remembered on the descriptor itself, as a _shouty_* attribute.
+# Most guards only have the one message, but the reverse foreignkey one picks
+# between two, so keeps both as a tuple.
+_MESSAGE_CACHE = {}  # type: Dict[Tuple[Any, type], Any]
+
+# The classes patch() has already replaced methods on, so that calling it
+# again (or Shout.ready() running more than once) doesn't wrap them twice.
+# Each class also gets a `_shouty = True` attribute, for anyone checking.
+_PATCHED = set()  # type: Set[type]
+
+# Setting SHOUTY_DISABLE=1 in the environment stops patch() from installing
+# anything at all, so the module can stay in INSTALLED_APPS for production-like
+# or benchmarking runs without costing anything on attribute access.
+_ENABLED = os.environ.get("SHOUTY_DISABLE") != "1"
+
+# Whether the installed patches should actually complain. These are only
+# consulted once a check has already failed, so the usual (successful) access
+# costs nothing extra. See disabled() for switching them off temporarily.
+_CHECK_LOCALS = True
+_CHECK_RELATIONS = True
+_CHECK_REVERSE_RELATIONS = True
+
 # This is used so that when .only() and .defer() are used, I can prevent the
 # bit which would cause a query for unselected fields.
 # noinspection PyProtectedMember
@@ -160,38 +195,105 @@ old_manytomany_descriptor_get = ManyToManyDescriptor.__get__
 old_foreignkey_descriptor_get_object = ForwardManyToOneDescriptor.get_object
 
 
-def new_deferredattribute_check_parent_chain(self, instance, name=None):
+# In Django 3.0, DeferredAttribute was refactored somewhat so that
+# _check_parent_chain no longer requires passing a name instance.
+# The Django version can't change once we're running, so rather than checking
+# it on every access to a deferred field, patch() installs whichever of the
+# following two is appropriate.
+def new_deferredattribute_check_parent_chain_pre30(self, instance, name=None):
     # type: (DeferredAttribute, Model, Optional[Text]) -> Any
     __traceback_hide__ = True
-    # In Django 3.0, DeferredAttribute was refactored somewhat so that
-    # _check_parent_chain no longer requires passing a name instance.
-    if DJANGO_VERSION[0:2] < (3, 0):
-        # noinspection PyArgumentList
-        val = old_deferredattribute_check_parent_chain(self, instance, name=name)
-    else:
-        val = old_deferredattribute_check_parent_chain(self, instance)
-        assert name is None, "Unexpected name value"
-        name = self.field.attname
-    if val is None:
-        raise MissingLocalField(
-            _TMPL_MISSING_LOCAL.format(attr=name, cls=instance.__class__.__name__,)
-        )
+    # noinspection PyArgumentList
+    val = old_deferredattribute_check_parent_chain(self, instance, name=name)
+    if val is None and _CHECK_LOCALS is True:
+        # Django 2.2 only ever passes this descriptor's own field_name.
+        key = (self, type(instance))
+        cached = _MESSAGE_CACHE.get(key)
+        if cached is None:
+            cached = _MESSAGE_CACHE[key] = _TMPL_MISSING_LOCAL % (
+                name,
+                type(instance).__name__,
+            )
+        raise MissingLocalField(cached)
     return val
 
 
-class MissingPrefetchRelatedManager(CallableObjectProxy):  # type: ignore
+def new_deferredattribute_check_parent_chain(self, instance):
+    # type: (DeferredAttribute, Model) -> Any
+    __traceback_hide__ = True
+    val = old_deferredattribute_check_parent_chain(self, instance)
+    if val is None and _CHECK_LOCALS is True:
+        key = (self, type(instance))
+        cached = _MESSAGE_CACHE.get(key)
+        if cached is None:
+            cached = _MESSAGE_CACHE[key] = _TMPL_MISSING_LOCAL % (
+                self.field.attname,
+                type(instance).__name__,
+            )
+        raise MissingLocalField(cached)
+    return val
+
+
+class MissingPrefetchRelatedManager(object):
+    """
+    Mixed into the class of a related manager which wasn't prefetched, so that
+    `.all()` errors loudly while everything else (`.add()`, `.filter()`,
+    `.count()` etc) is left to behave exactly as it normally would.
 
-    __slots__ = ("__wrapped__", "_self_error_message")
+    Wrapping the manager in a proxy instead would put an extra layer of
+    dispatch on every attribute access, when we only ever need to intercept
+    the one method.
+    """
 
-    def __init__(self, wrapped, error_message):
-        # type: (Manager, str) -> None
-        super(CallableObjectProxy, self).__init__(wrapped=wrapped)
-        self._self_error_message = error_message
+    # Set per manager instance by missing_prefetch_related_manager()
+    _shouty_error_message = ""  # type: Text
+    _shouty_reverse = False  # type: bool
 
     def all(self):
-        # type: () -> None
+        # type: () -> Any
         __traceback_hide__ = True
-        raise MissingReverseRelationField(self._self_error_message)
+        # The manager may have been fetched before disabled() was entered, so
+        # whether to complain has to be decided here rather than only when the
+        # descriptor was accessed.
+        if _CHECK_REVERSE_RELATIONS if self._shouty_reverse else _CHECK_RELATIONS:
+            raise MissingReverseRelationField(self._shouty_error_message)
+        return super(MissingPrefetchRelatedManager, self).all()  # type: ignore
+
+
+# Related manager classes are created by Django once per descriptor, so there's
+# only ever a handful of these, each built on first use.
+_MANAGER_CLASS_CACHE = {}  # type: Dict[type, type]
+
+
+def missing_prefetch_related_manager(manager, error_message, reverse):
+    # type: (Manager, Text, bool) -> Manager
+    """
+    Get a copy of the given related manager which shouts when `.all()` is
+    used, by giving its state to an instance of a subclass with
+    MissingPrefetchRelatedManager mixed in.
+
+    The manager Django handed out is left alone, because some versions (4.1.0
+    and 4.1.1) cache it on the instance, in which case changing its class would
+    carry on shouting after a later prefetch_related_objects().
+
+    reverse says whether it's _CHECK_REVERSE_RELATIONS or _CHECK_RELATIONS
+    which decides if it's still going to shout by the time `.all()` is called.
+    """
+    manager_cls = type(manager)
+    shouty_cls = _MANAGER_CLASS_CACHE.get(manager_cls)
+    if shouty_cls is None:
+        shouty_cls = _MANAGER_CLASS_CACHE[manager_cls] = type(
+            str("Shouty%s" % manager_cls.__name__),
+            (MissingPrefetchRelatedManager, manager_cls),
+            {},
+        )
+    # Skipping __init__ means the copy is as cheap as it can be, and doesn't
+    # repeat any of the work Django has already done setting the manager up.
+    shouty_manager = object.__new__(shouty_cls)  # type: Any
+    shouty_manager.__dict__.update(manager.__dict__)
+    shouty_manager._shouty_error_message = error_message
+    shouty_manager._shouty_reverse = reverse
+    return shouty_manager
 
 
 def new_reverse_foreignkey_descriptor_get(self, instance, cls=None):
@@ -219,28 +321,43 @@ def new_reverse_foreignkey_descriptor_get(self, instance, cls=None):
     if instance is None:
         return self
 
-    related_name = self.field.remote_field.get_cache_name()
+    related_name = self.__dict__.get("_shouty_related_name")
+    if related_name is None:
+        related_name = self.field.remote_field.get_cache_name()
+        self._shouty_related_name = related_name
     manager = old_reverse_foreignkey_descriptor_get(self, instance, cls)
 
-    # noinspection PyProtectedMember
-    if not hasattr(instance, "_prefetched_objects_cache"):
-        return MissingPrefetchRelatedManager(
-            manager,
-            error_message=_TMPL_MISSING_ANY_PREFETCH_REVERSE.format(
-                attr=related_name, cls=instance.__class__.__name__,
-            ),
+    # Django's prefetching puts this directly into the instance __dict__, so
+    # peeking there avoids hasattr() going through the whole attribute protocol.
+    prefetched = instance.__dict__.get("_prefetched_objects_cache")
+    # The membership test comes first as it's the usual reason to get past
+    # this point. An empty cache means prefetching is still underway.
+    if prefetched is not None and (related_name in prefetched or not prefetched):
+        return manager
+    if _CHECK_REVERSE_RELATIONS is False:
+        return manager
+    # Django's manager gives back .none() without querying if the instance has
+    # nothing to filter by (ie: it's unsaved), so there's nothing to prevent.
+    values = instance.__dict__
+    for target in self.field.foreign_related_fields:
+        if target.attname in values and values[target.attname] is None:
+            return manager
+
+    key = (self, type(instance))
+    messages = _MESSAGE_CACHE.get(key)
+    if messages is None:
+        cls_name = type(instance).__name__
+        messages = _MESSAGE_CACHE[key] = (
+            _TMPL_MISSING_ANY_PREFETCH_REVERSE % (related_name, cls_name),
+            _TMPL_MISSING_SPECIFIC_PREFETCH_REVERSE % (related_name, cls_name),
         )
-    elif (
-        instance._prefetched_objects_cache
-        and related_name not in instance._prefetched_objects_cache
-    ):
-        return MissingPrefetchRelatedManager(
-            manager,
-            error_message=_TMPL_MISSING_SPECIFIC_PREFETCH_REVERSE.format(
-                attr=related_name, cls=instance.__class__.__name__,
-            ),
+    if prefetched is None:
+        return missing_prefetch_related_manager(
+            manager, error_message=messages[0], reverse=True
         )
-    return manager
+    return missing_prefetch_related_manager(
+        manager, error_message=messages[1], reverse=True
+    )
 
 
 def new_reverse_onetoone_descriptor_get(self, instance, cls=None):
@@ -267,15 +384,27 @@ def new_reverse_onetoone_descriptor_get(self, instance, cls=None):
     __traceback_hide__ = True
     if instance is None:
         return self
-    try:
-        self.related.get_cached_value(instance)
-    except KeyError:
-        attr = self.related.get_accessor_name()
-        raise MissingRelationField(
-            _TMPL_MISSING_REVERSE_121.format(
-                attr=attr, cls=instance.__class__.__name__,
+    cache_name = self.__dict__.get("_shouty_cache_name")
+    if cache_name is None:
+        cache_name = self._shouty_cache_name = self.related.get_cache_name()
+    # This is the dict self.related.get_cached_value() would look in; testing
+    # for membership avoids raising and catching a KeyError for every miss.
+    # Django doesn't query for an unsaved instance, it goes straight to raising
+    # RelatedObjectDoesNotExist, so that's left to happen as normal.
+    # noinspection PyProtectedMember
+    if (
+        cache_name not in instance._state.fields_cache
+        and _CHECK_REVERSE_RELATIONS is True
+        and instance.pk is not None
+    ):
+        key = (self, type(instance))
+        cached = _MESSAGE_CACHE.get(key)
+        if cached is None:
+            cached = _MESSAGE_CACHE[key] = _TMPL_MISSING_REVERSE_121 % (
+                self.related.get_accessor_name(),
+                type(instance).__name__,
             )
-        )
+        raise MissingRelationField(cached)
     return old_reverse_onetoone_descriptor_get(self, instance, cls)
 
 
@@ -291,37 +420,37 @@ def new_manytomany_descriptor_get(self, instance, cls=None):
     if instance is None:
         return self
 
-    if self.reverse is True:
-        related_name = self.field.remote_field.get_cache_name()
-    else:
-        related_name = self.field.get_cache_name()
-
     manager = old_manytomany_descriptor_get(self, instance, cls)
-    prefetch_name = manager.prefetch_cache_name
-
-    # noinspection PyProtectedMember
-    if not hasattr(instance, "_prefetched_objects_cache"):
-        return MissingPrefetchRelatedManager(
-            manager,
-            error_message=_TMPL_MISSING_M2M_PREFETCH.format(
-                attr=related_name, cls=instance.__class__.__name__,
-            ),
+    # The prefetch cache name is derived from the field, not the instance,
+    # so it's the same for every manager this descriptor hands out.
+    prefetch_name = self.__dict__.get("_shouty_prefetch_name")
+    if prefetch_name is None:
+        prefetch_name = self._shouty_prefetch_name = manager.prefetch_cache_name
+
+    prefetched = instance.__dict__.get("_prefetched_objects_cache")
+    if prefetched is not None and (prefetch_name in prefetched or not prefetched):
+        return manager
+    if _CHECK_RELATIONS is False:
+        return manager
+
+    key = (self, type(instance))
+    message = _MESSAGE_CACHE.get(key)
+    if message is None:
+        if self.reverse is True:
+            related_name = self.field.remote_field.get_cache_name()
+        else:
+            related_name = self.field.get_cache_name()
+        message = _MESSAGE_CACHE[key] = _TMPL_MISSING_M2M_PREFETCH % (
+            related_name,
+            type(instance).__name__,
         )
-    elif (
-        instance._prefetched_objects_cache
-        and prefetch_name not in instance._prefetched_objects_cache
-    ):
-        return MissingPrefetchRelatedManager(
-            manager,
-            error_message=_TMPL_MISSING_M2M_PREFETCH.format(
-                attr=related_name, cls=instance.__class__.__name__,
-            ),
-        )
-    return manager
+    return missing_prefetch_related_manager(
+        manager, error_message=message, reverse=False
+    )
 
 
 def new_foreignkey_descriptor_get_object(self, instance):
-    # type: (ForwardManyToOneDescriptor, Model) -> None
+    # type: (ForwardManyToOneDescriptor, Model) -> Any
     """
     In a scenario with a model like the below:
 
@@ -332,11 +461,16 @@ def new_foreignkey_descriptor_get_object(self, instance):
     without having either used prefetch_related() or select_related()
     """
     __traceback_hide__ = True
-    raise MissingRelationField(
-        _TMPL_MISSING_LOCAL_FK.format(
-            attr=self.field.get_cache_name(), cls=instance.__class__.__name__,
+    if _CHECK_RELATIONS is False:
+        return old_foreignkey_descriptor_get_object(self, instance)
+    key = (self, type(instance))
+    cached = _MESSAGE_CACHE.get(key)
+    if cached is None:
+        cached = _MESSAGE_CACHE[key] = _TMPL_MISSING_LOCAL_FK % (
+            self.field.get_cache_name(),
+            type(instance).__name__,
         )
-    )
+    raise MissingRelationField(cached)
 
 
 def patch(invalid_locals, invalid_relations, invalid_reverse_relations):
@@ -355,45 +489,124 @@ def patch(invalid_locals, invalid_relations, invalid_reverse_relations):
     if invalid_relations is turned on, accessing local foreignkeys
     which have not been `prefetch_related()` or `select_related()` at the queryset
     level will error loudly.
+
+    if the SHOUTY_DISABLE environment variable is set to 1, nothing is patched
+    and False is returned.
     """
-    if invalid_locals is True:
-        patched_deferredattr = getattr(DeferredAttribute, "_shouty", False)
-        if patched_deferredattr is False:
-            DeferredAttribute._check_parent_chain = (
-                new_deferredattribute_check_parent_chain
-            )
-            DeferredAttribute._shouty = True
+    if _ENABLED is False:
+        return False
 
-    if invalid_relations is True:
+    if DJANGO_VERSION[0:2] < (3, 0):
+        new_deferredattribute = (
+            new_deferredattribute_check_parent_chain_pre30
+        )  # type: Any
+    else:
+        new_deferredattribute = new_deferredattribute_check_parent_chain
+
+    # ManyToManyDescriptor subclasses ReverseManyToOneDescriptor without having
+    # a __get__ of its own, so pin the original on it first, otherwise m2m
+    # managers would get the reverse foreignkey checks even if
+    # invalid_relations is off.
+    if invalid_reverse_relations is True and ManyToManyDescriptor not in _PATCHED:
+        ManyToManyDescriptor.__get__ = old_manytomany_descriptor_get
+
+    # patched_onetoone = getattr(ForwardManyToOneDescriptor, "_shouty", False)
+    # ForwardOneToOneDescriptor
+    patches = (
+        (
+            invalid_locals,
+            DeferredAttribute,
+            "_check_parent_chain",
+            new_deferredattribute,
+        ),
+        (
+            invalid_relations,
+            ForwardManyToOneDescriptor,
+            "get_object",
+            new_foreignkey_descriptor_get_object,
+        ),
+        (
+            invalid_relations,
+            ManyToManyDescriptor,
+            "__get__",
+            new_manytomany_descriptor_get,
+        ),
+        (
+            invalid_reverse_relations,
+            ReverseOneToOneDescriptor,
+            "__get__",
+            new_reverse_onetoone_descriptor_get,
+        ),
+        (
+            invalid_reverse_relations,
+            ReverseManyToOneDescriptor,
+            "__get__",
+            new_reverse_foreignkey_descriptor_get,
+        ),
+    )  # type: Tuple[Tuple[bool, type, str, Any], ...]
+    for enabled, cls, attr, new_method in patches:
+        if enabled is True and cls not in _PATCHED:
+            setattr(cls, attr, new_method)
+            cls._shouty = True  # type: ignore
+            _PATCHED.add(cls)
 
-        patched_manytoone = getattr(ForwardManyToOneDescriptor, "_shouty", False)
-        if patched_manytoone is False:
-            ForwardManyToOneDescriptor.get_object = new_foreignkey_descriptor_get_object
-            ForwardManyToOneDescriptor._shouty = True
+    return True
 
-        # patched_onetoone = getattr(ForwardManyToOneDescriptor, "_shouty", False)
-        # ForwardOneToOneDescriptor
 
-        patched_manytomany = getattr(ManyToManyDescriptor, "_shouty", False)
-        if patched_manytomany is False:
-            ManyToManyDescriptor.__get__ = new_manytomany_descriptor_get
-            ManyToManyDescriptor._shouty = True
+def _prime_descriptors(models):
+    # type: (Iterable[Type[Model]]) -> None
+    """
+    Work out the names the patched reverse descriptors need up front, rather
+    than on the first access to each one. They're remembered on the descriptors
+    the same way the patched methods would remember them, and those still fall
+    back to calculating them for anything not seen here.
+    """
+    for model in models:
+        # Only the relations are looked at, and their descriptors are taken out
+        # of the class __dict__, so nothing else declared on the model (like
+        # something lazy which would evaluate on an isinstance() check) is
+        # touched.
+        # noinspection PyProtectedMember
+        for rel in model._meta.get_fields(include_parents=False):
+            # The m2m prefetch name is read off the first manager built, so
+            # there's nothing to be done for those here.
+            if not rel.auto_created or rel.concrete or rel.many_to_many:
+                continue
+            descriptor = model.__dict__.get(rel.get_accessor_name())  # type: Any
+            descriptor_cls = type(descriptor)
+            if rel.one_to_many and issubclass(
+                descriptor_cls, ReverseManyToOneDescriptor
+            ):
+                related_name = descriptor.field.remote_field.get_cache_name()
+                descriptor._shouty_related_name = related_name
+            elif rel.one_to_one and issubclass(
+                descriptor_cls, ReverseOneToOneDescriptor
+            ):
+                cache_name = descriptor.related.get_cache_name()
+                descriptor._shouty_cache_name = cache_name
 
-    if invalid_reverse_relations is True:
-        patched_reverse_onetone = getattr(ReverseOneToOneDescriptor, "_shouty", False)
-        if patched_reverse_onetone is False:
-            ReverseOneToOneDescriptor.__get__ = new_reverse_onetoone_descriptor_get
-            ReverseOneToOneDescriptor._shouty = True
 
-        patched_reverse_manytoone = getattr(
-            ReverseManyToOneDescriptor, "_shouty", False
-        )
+@contextmanager
+def disabled():
+    # type: () -> Iterator[None]
+    """
+    Temporarily stop any applied patches from erroring, so that code inside the
+    with block gets Django's normal behaviour of silently doing the extra
+    queries:
 
-        if patched_reverse_manytoone is False:
-            ReverseManyToOneDescriptor.__get__ = new_reverse_foreignkey_descriptor_get
-            ReverseManyToOneDescriptor._shouty = True
+    with shoutyorm.disabled():
+        mymodel.myothermodel_set.all()
 
-    return True
+    This only flips some module level flags rather than undoing the patches, so
+    it's cheap, but it's also process wide rather than per thread.
+    """
+    global _CHECK_LOCALS, _CHECK_RELATIONS, _CHECK_REVERSE_RELATIONS
+    previous = (_CHECK_LOCALS, _CHECK_RELATIONS, _CHECK_REVERSE_RELATIONS)
+    _CHECK_LOCALS = _CHECK_RELATIONS = _CHECK_REVERSE_RELATIONS = False
+    try:
+        yield
+    finally:
+        _CHECK_LOCALS, _CHECK_RELATIONS, _CHECK_REVERSE_RELATIONS = previous
 
 
 class Shout(AppConfig):  # type: ignore
@@ -426,14 +639,20 @@ class Shout(AppConfig):  # type: ignore
         # about django not being configured yet.
         from django.conf import settings
 
+        if _ENABLED is False:
+            logger.info("Not applying shouty ORM patch, SHOUTY_DISABLE is set")
+            return False
         logger.info("Applying shouty ORM patch")
-        return patch(
+        patched = patch(
             invalid_locals=getattr(settings, "SHOUTY_LOCAL_FIELDS", True),
             invalid_relations=getattr(settings, "SHOUTY_RELATION_FIELDS", True),
             invalid_reverse_relations=getattr(
                 settings, "SHOUTY_RELATION_REVERSE_FIELDS", True
             ),
         )
+        # All the models are loaded by the time ready() is called.
+        _prime_descriptors(self.apps.get_models())
+        return patched
 
 
 default_app_config = "shoutyorm.Shout"
@@ -479,11 +698,54 @@ if __name__ == "__main__":
         SHOUTY_RELATION_REVERSE_FIELDS=True,
     )
     django.setup()
+    from django.db import connection, models
     from django.db.models import Prefetch
     from django.contrib.auth.models import User, Group, Permission
     from django.contrib.contenttypes.models import ContentType
+    from django.contrib.admin.models import LogEntry
     from django import forms
     from django.template import Template, Context
+    from django.utils.functional import SimpleLazyObject
+
+    # The patches were applied by importing the shoutyorm module for the app
+    # config, which isn't this __main__ one, so the exceptions the tests expect
+    # to see are that module's classes rather than the ones defined above.
+    import shoutyorm
+
+    # Before Django 3.0, m2m add() and set() selected the existing rows before
+    # inserting, so took one more query.
+    _M2M_WRITE_EXTRA_QUERIES = 1 if DJANGO_VERSION[0:2] < (3, 0) else 0
+
+    class Profile(models.Model):  # type: ignore
+        """
+        Nothing in contrib has a OneToOneField, so this only exists to give
+        User a reverse one-to-one (user.profile) to test against.
+        It's unmanaged so the test database doesn't get it during setup; the
+        test cases which need it create the table via ProfileTableMixin.
+        """
+
+        user = models.OneToOneField(User, on_delete=models.CASCADE)
+
+        class Meta:
+            app_label = "shoutyorm"
+            managed = False
+
+    class ProfileTableMixin(object):
+        @classmethod
+        def setUpClass(cls):
+            # type: () -> None
+            # This has to happen before TestCase opens its transaction, as the
+            # SQLite schema editor refuses to run inside of one.
+            with connection.schema_editor() as editor:
+                editor.create_model(Profile)
+            super(ProfileTableMixin, cls).setUpClass()  # type: ignore
+
+        @classmethod
+        def tearDownClass(cls):
+            # type: () -> None
+            super(ProfileTableMixin, cls).tearDownClass()  # type: ignore
+            with connection.schema_editor() as editor:
+                editor.delete_model(Profile)
 
     # noinspection PyStatementEffect
     class LocalFieldsTestCase(TestCase):  # type: ignore
@@ -492,16 +754,14 @@ if __name__ == "__main__":
         is in play.
         """
 
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingLocalField
+        MissingLocalField = shoutyorm.MissingLocalField
 
-            self.MissingLocalField = MissingLocalField
-            self.instance = User.objects.create()
+        @classmethod
+        def setUpTestData(cls):
+            # type: () -> None
+            # Created once for the whole class, each test's changes are rolled
+            # back around it.
+            cls.instance = User.objects.create()
 
         def test_normal_behaviour(self):
             # type: () -> None
@@ -577,15 +837,7 @@ if __name__ == "__main__":
         - new_foreignkey_descriptor_get_object
         """
 
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingRelationField
-
-            self.MissingRelationField = MissingRelationField
+        MissingRelationField = shoutyorm.MissingRelationField
 
         def test_accessing_foreignkey_with_select_related(self):
             # type: () -> None
@@ -620,15 +872,7 @@ if __name__ == "__main__":
         new_reverse_foreignkey_descriptor_get
         """
 
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingReverseRelationField
-
-            self.MissingReverseRelationField = MissingReverseRelationField
+        MissingReverseRelationField = shoutyorm.MissingReverseRelationField
 
         def test_accessing_other_side_of_foreignkey(self):
             # type: () -> None
@@ -643,6 +887,16 @@ if __name__ == "__main__":
                 ):
                     obj.permission_set.all()
 
+        def test_accessing_other_side_of_foreignkey_when_unsaved(self):
+            # type: () -> None
+            """
+            Django won't query for the reverse side of an unsaved instance, so
+            there's nothing to complain about.
+            """
+            obj = ContentType(app_label="test", model="test")
+            with self.assertNumQueries(0):
+                self.assertEqual(tuple(obj.permission_set.all()), ())
+
         def test_accessing_other_side_of_foreignkey_with_prefetch_related(self):
             # type: () -> None
             with self.assertNumQueries(2):
@@ -694,20 +948,14 @@ if __name__ == "__main__":
                 user = User.objects.create(username="test")
             with self.assertNumQueries(1):
                 group.user_set.clear()
-            q = 1
-            if DJANGO_VERSION[0:2] < (3, 0):
-                q = 2
-            with self.assertNumQueries(q):
+            with self.assertNumQueries(1 + _M2M_WRITE_EXTRA_QUERIES):
                 group.user_set.add(user)
             with self.assertNumQueries(1):
                 group.user_set.remove(user)
             with self.assertNumQueries(2):
                 self.assertIsNone(group.user_set.first())
                 self.assertIsNone(group.user_set.last())
-            q = 2
-            if DJANGO_VERSION[0:2] < (3, 0):
-                q = 3
-            with self.assertNumQueries(q):
+            with self.assertNumQueries(2 + _M2M_WRITE_EXTRA_QUERIES):
                 group.user_set.set((user,))
             # Not sure why both of these are 0 queries? Neither uses the _result_cache
             # AFAIK, so surely they should always do one?
@@ -724,17 +972,73 @@ if __name__ == "__main__":
                 self.assertIsNotNone(group.user_set.first())
                 self.assertIsNotNone(group.user_set.last())
 
-    class MostlyM2MPrefetchRelatedTestCase(TestCase):  # type: ignore
-        def setUp(self):
+    class ReverseOneToOneTestCase(ProfileTableMixin, TestCase):  # type: ignore
+        """
+        These tests should demonstrate behaviour of
+        new_reverse_onetoone_descriptor_get
+        """
+
+        MissingRelationField = shoutyorm.MissingRelationField
+
+        @classmethod
+        def setUpTestData(cls):
             # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingRelationField
+            cls.user = User.objects.create()
+            Profile.objects.create(user=cls.user)
 
-            self.MissingRelationField = MissingRelationField
-            self.user = User.objects.create()
+        def test_accessing_reverse_onetoone_fails_if_not_selected(self):
+            # type: () -> None
+            with self.assertNumQueries(1):
+                obj = User.objects.get(pk=self.user.pk)  # type: User
+                with self.assertRaisesMessage(
+                    self.MissingRelationField,
+                    "Access to 'profile' relation attribute on User was prevented because it was not selected.\nProbably missing from select_related()",
+                ):
+                    obj.profile
+
+        def test_accessing_reverse_onetoone_ok_if_selected(self):
+            # type: () -> None
+            with self.assertNumQueries(1):
+                obj = User.objects.select_related("profile").get(
+                    pk=self.user.pk
+                )  # type: User
+            with self.assertNumQueries(0):
+                obj.profile.pk
+
+        def test_accessing_reverse_onetoone_when_unsaved(self):
+            # type: () -> None
+            """
+            Django won't query for the reverse side of an unsaved instance, it
+            just raises DoesNotExist, so that's left alone.
+            """
+            obj = User()
+            with self.assertNumQueries(0):
+                with self.assertRaises(Profile.DoesNotExist):
+                    obj.profile
+
+        def test_cache_name_primed(self):
+            # type: () -> None
+            """
+            Profile was defined after Shout.ready() ran, so forget anything
+            remembered by the other tests and run ready() again to prove it
+            fills in the cache name.
+            """
+            from django.apps import apps
+
+            descriptor = vars(User)["profile"]
+            vars(descriptor).pop("_shouty_cache_name", None)
+            apps.get_app_config("shoutyorm").ready()
+            self.assertEqual(vars(descriptor)["_shouty_cache_name"], "profile")
+
+    class MostlyM2MPrefetchRelatedTestCase(TestCase):  # type: ignore
+        MissingRelationField = shoutyorm.MissingRelationField
+
+        @classmethod
+        def setUpTestData(cls):
+            # type: () -> None
+            # Created once for the whole class, each test's changes are rolled
+            # back around it.
+            cls.user = User.objects.create()
 
         def test_accessing_nonprefetched_m2m_works_when_trying_to_add(self):
             # type: () -> None
@@ -744,10 +1048,7 @@ if __name__ == "__main__":
             """
             with self.assertNumQueries(1):
                 i = User.objects.get(pk=self.user.pk)
-            q = 2
-            if DJANGO_VERSION[0:2] < (3, 0):
-                q = 3
-            with self.assertNumQueries(q):
+            with self.assertNumQueries(2 + _M2M_WRITE_EXTRA_QUERIES):
                 i.groups.add(Group.objects.create(name="test"))
 
         def test_accessing_nonprefetched_m2m_fails_when_accessing_all(self):
@@ -768,6 +1069,24 @@ if __name__ == "__main__":
                 ):
                     i.user_permissions.all()
 
+        def test_nonprefetched_m2m_leaves_django_manager_alone(self):
+            # type: () -> None
+            """
+            Some Django versions cache related managers on the instance, so
+            the one Django built mustn't be turned into a shouty one itself.
+            """
+            i = User.objects.get(pk=self.user.pk)
+            manager = shoutyorm.old_manytomany_descriptor_get(vars(User)["groups"], i)
+            shouty = shoutyorm.missing_prefetch_related_manager(
+                manager, error_message="nope", reverse=False
+            )
+            self.assertIsNot(shouty, manager)
+            self.assertNotIsInstance(manager, shoutyorm.MissingPrefetchRelatedManager)
+            with self.assertRaisesMessage(self.MissingRelationField, "nope"):
+                shouty.all()
+            with self.assertNumQueries(1):
+                tuple(manager.all())
+
         def test_accessing_nonprefetched_nested_relations_fails(self):
             # type: () -> None
             """
@@ -857,24 +1176,39 @@ if __name__ == "__main__":
                 tuple(i.user_permissions.all())
                 tuple(i.groups.all()[0].permissions.all())
 
+        def test_accessing_relations_involving_nested_prefetch_objects_is_ok(self):
+            # type: () -> None
+            """
+            Prefetching the permissions via the Prefetch object's queryset
+            rather than "groups__permissions" is still one query per relation.
+            """
+            self.user.groups.add(Group.objects.create(name="test"))
+            with self.assertNumQueries(4):
+                i = User.objects.prefetch_related(
+                    Prefetch(
+                        "groups", queryset=Group.objects.prefetch_related("permissions")
+                    ),
+                    "user_permissions",
+                ).get(pk=self.user.pk)
+            with self.assertNumQueries(0):
+                tuple(i.groups.all())
+                tuple(i.user_permissions.all())
+                tuple(i.groups.all()[0].permissions.all())
+
     class PrefetchReverseRelatedTestCase(TestCase):  # type: ignore
         """
-        Demonstrate how
-        - new_manytomany_descriptor_get
-        - new_modeliterable_iter
-        interact with things.
+        Demonstrate how new_manytomany_descriptor_get interacts with the
+        reverse side of a ManyToManyField.
         """
 
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingRelationField
+        MissingRelationField = shoutyorm.MissingRelationField
 
-            self.MissingRelationField = MissingRelationField
-            self.group = Group.objects.create()
+        @classmethod
+        def setUpTestData(cls):
+            # type: () -> None
+            # Created once for the whole class, each test's changes are rolled
+            # back around it.
+            cls.group = Group.objects.create()
 
         def test_accessing_nonprefetched_m2m_works_when_trying_to_add(self):
             # type: () -> None
@@ -884,10 +1218,7 @@ if __name__ == "__main__":
             """
             with self.assertNumQueries(1):
                 i = Group.objects.get(pk=self.group.pk)
-            q = 2
-            if DJANGO_VERSION[0:2] < (3, 0):
-                q = 3
-            with self.assertNumQueries(q):
+            with self.assertNumQueries(2 + _M2M_WRITE_EXTRA_QUERIES):
                 i.user_set.add(User.objects.create())
 
         def test_accessing_nonprefetched_m2m_fails_when_accessing_all(self):
@@ -984,25 +1315,14 @@ if __name__ == "__main__":
                 tuple(i.user_set.all()[0].user_permissions.all())
 
     class ForwardManyToOneDescriptorTestCase(TestCase):  # type: ignore
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingRelationField, MissingLocalField
-
-            self.MissingLocalField = MissingLocalField
-            self.MissingRelationField = MissingRelationField
+        MissingLocalField = shoutyorm.MissingLocalField
+        MissingRelationField = shoutyorm.MissingRelationField
 
-        # noinspection PyStatementEffect
-        def test_accessing_fks_on_this_side_fails_if_not_prefetched(self):
+        @classmethod
+        def setUpTestData(cls):
             # type: () -> None
-            from django.contrib.admin.models import LogEntry
-            from django.contrib.auth.models import User
-            from django.contrib.contenttypes.models import ContentType
-
-            example = LogEntry.objects.create(
+            # The tests only ever read it back, so one is enough for them all.
+            cls.example = LogEntry.objects.create(
                 user=User.objects.create(),
                 content_type=ContentType.objects.get_for_model(User),
                 object_id="",
@@ -1010,8 +1330,12 @@ if __name__ == "__main__":
                 action_flag=1,
                 change_message="",
             )
+
+        # noinspection PyStatementEffect
+        def test_accessing_fks_on_this_side_fails_if_not_prefetched(self):
+            # type: () -> None
             with self.assertNumQueries(1):
-                i = LogEntry.objects.get(pk=example.pk)
+                i = LogEntry.objects.get(pk=self.example.pk)
             with self.assertNumQueries(0):
                 i.object_id
                 i.object_repr
@@ -1031,21 +1355,9 @@ if __name__ == "__main__":
         # noinspection PyStatementEffect
         def test_accessing_fks_on_this_side_ok_if_selected(self):
             # type: () -> None
-            from django.contrib.admin.models import LogEntry
-            from django.contrib.auth.models import User
-            from django.contrib.contenttypes.models import ContentType
-
-            example = LogEntry.objects.create(
-                user=User.objects.create(),
-                content_type=ContentType.objects.get_for_model(User),
-                object_id="",
-                object_repr="",
-                action_flag=1,
-                change_message="",
-            )
             with self.assertNumQueries(1):
                 i = LogEntry.objects.select_related("content_type", "user").get(
-                    pk=example.pk
+                    pk=self.example.pk
                 )
             with self.assertNumQueries(0):
                 i.object_id
@@ -1058,21 +1370,9 @@ if __name__ == "__main__":
         # noinspection PyStatementEffect
         def test_accessing_fks_on_this_side_ok_if_prefetched(self):
             # type: () -> None
-            from django.contrib.admin.models import LogEntry
-            from django.contrib.auth.models import User
-            from django.contrib.contenttypes.models import ContentType
-
-            example = LogEntry.objects.create(
-                user=User.objects.create(),
-                content_type=ContentType.objects.get_for_model(User),
-                object_id="",
-                object_repr="",
-                action_flag=1,
-                change_message="",
-            )
             with self.assertNumQueries(3):
                 i = LogEntry.objects.prefetch_related("content_type", "user").get(
-                    pk=example.pk
+                    pk=self.example.pk
                 )
             with self.assertNumQueries(0):
                 i.object_id
@@ -1089,16 +1389,8 @@ if __name__ == "__main__":
         to cause issues or corrections.
         """
 
-        def setUp(self):
-            # type: () -> None
-            # Have to import the exceptions here to avoid __main__.ExceptionCls
-            # not being the same as shoutyorm.ExceptionCls, otherwise the test
-            # cases have to be outside the __main__ block.
-            # noinspection PyUnresolvedReferences
-            from shoutyorm import MissingRelationField, MissingLocalField
-
-            self.MissingLocalField = MissingLocalField
-            self.MissingRelationField = MissingRelationField
+        MissingLocalField = shoutyorm.MissingLocalField
+        MissingRelationField = shoutyorm.MissingRelationField
 
         def test_foreignkey_in_form(self):
             # type: () -> None
@@ -1190,12 +1482,8 @@ if __name__ == "__main__":
         Got to check that the exceptions
         """
 
-        def setUp(self):
-            # type: () -> None
-            from shoutyorm import MissingLocalField, MissingRelationField
-
-            self.MissingLocalField = MissingLocalField
-            self.MissingRelationField = MissingRelationField
+        MissingLocalField = shoutyorm.MissingLocalField
+        MissingRelationField = shoutyorm.MissingRelationField
 
         def test_local(self):
             # type: () -> None
@@ -1278,9 +1566,154 @@ if __name__ == "__main__":
             ):
                 tmpl.render(Context({"g": g,}))
 
+    class PatchTestCase(ProfileTableMixin, TestCase):  # type: ignore
+        def test_disabled_by_environment(self):
+            # type: () -> None
+            """
+            SHOUTY_DISABLE=1 is read at import time into _ENABLED, after which
+            patch() shouldn't touch anything.
+            """
+            self.assertTrue(shoutyorm.patch(True, True, True))
+            shoutyorm._ENABLED = False
+            try:
+                self.assertFalse(shoutyorm.patch(True, True, True))
+            finally:
+                shoutyorm._ENABLED = True
+
+        def test_manytomany_without_relation_checks(self):
+            # type: () -> None
+            """
+            ManyToManyDescriptor inherits __get__ from ReverseManyToOneDescriptor,
+            so with only the reverse checks on, m2m managers mustn't end up
+            going through the reverse foreignkey guard.
+            """
+            patched_get = vars(ManyToManyDescriptor)["__get__"]
+            del ManyToManyDescriptor.__get__
+            shoutyorm._PATCHED.discard(ManyToManyDescriptor)
+            try:
+                shoutyorm.patch(False, False, True)
+                self.assertIs(
+                    vars(ManyToManyDescriptor)["__get__"],
+                    shoutyorm.old_manytomany_descriptor_get,
+                )
+                obj = User.objects.get(pk=User.objects.create().pk)  # type: User
+                with self.assertNumQueries(1):
+                    tuple(obj.groups.all())
+            finally:
+                ManyToManyDescriptor.__get__ = patched_get
+                shoutyorm._PATCHED.add(ManyToManyDescriptor)
+
+        def test_descriptors_primed(self):
+            # type: () -> None
+            """
+            Shout.ready() should've filled in the names for descriptors which
+            the other tests may never touch.
+            """
+            self.assertEqual(
+                vars(ContentType.permission_set).get("_shouty_related_name"),
+                "permission_set",
+            )
+
+        def test_priming_descriptors_leaves_other_attributes_alone(self):
+            # type: () -> None
+            """
+            Anything on a model which isn't a relation shouldn't be looked at,
+            otherwise lazy objects would be evaluated when the app is ready.
+            """
+            evaluated = []
+
+            def setup():
+                # type: () -> int
+                evaluated.append(True)
+                return 1
+
+            ContentType.shouty_lazy = SimpleLazyObject(setup)
+            try:
+                shoutyorm._prime_descriptors([ContentType])
+            finally:
+                del ContentType.shouty_lazy
+            self.assertEqual(evaluated, [])
+
+        def test_disabled_context_manager(self):
+            # type: () -> None
+            user = User.objects.create()
+            user.groups.add(Group.objects.create())
+            obj = User.objects.only("pk").get(pk=user.pk)  # type: User
+            with shoutyorm.disabled():
+                with self.assertNumQueries(2):
+                    obj.first_name
+                    tuple(obj.groups.all())
+            with self.assertRaises(shoutyorm.MissingLocalField):
+                obj.last_name
+            with self.assertRaises(shoutyorm.MissingRelationField):
+                obj.groups.all()
+
+        def test_disabled_context_manager_foreignkey(self):
+            # type: () -> None
+            entry = LogEntry.objects.create(
+                user=User.objects.create(),
+                content_type=ContentType.objects.get_for_model(User),
+                object_id="",
+                object_repr="",
+                action_flag=1,
+                change_message="",
+            )
+            obj = LogEntry.objects.get(pk=entry.pk)  # type: LogEntry
+            with shoutyorm.disabled():
+                with self.assertNumQueries(1):
+                    obj.user
+            obj = LogEntry.objects.get(pk=entry.pk)
+            with self.assertRaises(shoutyorm.MissingRelationField):
+                obj.user
+
+        def test_disabled_context_manager_reverse_foreignkey(self):
+            # type: () -> None
+            ct = ContentType.objects.get_for_model(User)
+            obj = ContentType.objects.get(pk=ct.pk)  # type: ContentType
+            with shoutyorm.disabled():
+                with self.assertNumQueries(1):
+                    tuple(obj.permission_set.all())
+            with self.assertRaises(shoutyorm.MissingReverseRelationField):
+                obj.permission_set.all()
+
+        def test_disabled_context_manager_reverse_onetoone(self):
+            # type: () -> None
+            user = User.objects.create()
+            Profile.objects.create(user=user)
+            obj = User.objects.get(pk=user.pk)  # type: User
+            with shoutyorm.disabled():
+                with self.assertNumQueries(1):
+                    obj.profile
+            obj = User.objects.get(pk=user.pk)
+            with self.assertRaises(shoutyorm.MissingRelationField):
+                obj.profile
+
+        def test_disabled_context_manager_after_getting_manager(self):
+            # type: () -> None
+            """
+            Managers obtained before entering the block should still do their
+            queries inside it, and go back to complaining afterwards.
+            """
+            user = User.objects.create()
+            ct = ContentType.objects.get_for_model(User)
+            groups = User.objects.get(pk=user.pk).groups
+            permissions = ContentType.objects.get(pk=ct.pk).permission_set
+            with shoutyorm.disabled():
+                with self.assertNumQueries(2):
+                    tuple(groups.all())
+                    tuple(permissions.all())
+            with self.assertRaises(shoutyorm.MissingRelationField):
+                groups.all()
+            with self.assertRaises(shoutyorm.MissingReverseRelationField):
+                permissions.all()
+
     class MyPyTestCase(TestCase):  # type: ignore
         def test_for_types(self):
             # type: () -> None
+            # Type checking the whole file takes far longer than all the other
+            # tests put together, so it's opt-in.
+            if os.environ.get("SHOUTYORM_RUN_MYPY") != "1":
+                self.skipTest("set SHOUTYORM_RUN_MYPY=1 to type check")
             try:
                 from mypy import api as mypy
             except ImportError:
@@ -1295,7 +1728,14 @@ if __name__ == "__main__":
                 elif exit_code > 0:
                     self.fail(report)
 
-    test_runner = DiscoverRunner(interactive=False, verbosity=2)
+    # The whole suite only takes a moment, so running it across processes is
+    # opt-in, eg: SHOUTYORM_PARALLEL=4
+    # Likewise listing every test as it runs: SHOUTYORM_VERBOSITY=2
+    test_runner = DiscoverRunner(
+        interactive=False,
+        verbosity=int(os.environ.get("SHOUTYORM_VERBOSITY", "1")),
+        parallel=int(os.environ.get("SHOUTYORM_PARALLEL", "1")),
+    )
     failures = test_runner.run_tests(
         test_labels=(),
         extra_tests=(
@@ -1310,11 +1750,13 @@ if __name__ == "__main__":
             test_runner.test_loader.loadTestsFromTestCase(
                 ReverseRelationFieldsTestCase
             ),
+            test_runner.test_loader.loadTestsFromTestCase(ReverseOneToOneTestCase),
             test_runner.test_loader.loadTestsFromTestCase(FormTestCase),
             test_runner.test_loader.loadTestsFromTestCase(TemplateTestCase),
             test_runner.test_loader.loadTestsFromTestCase(
                 ForwardManyToOneDescriptorTestCase
             ),
+            test_runner.test_loader.loadTestsFromTestCase(PatchTestCase),
             test_runner.test_loader.loadTestsFromTestCase(MyPyTestCase),
         ),
     )